@@ -0,0 +1,202 @@
+"""Async variants of the API helpers in main.py.
+
+The helpers here take a shared ``httpx.AsyncClient`` so callers can batch
+many calls with ``asyncio.gather(...)`` and pay only the slowest round trip
+instead of the sum of them:
+
+    async with api_session() as client:
+        notes = await asyncio.gather(*[get_note_async(client, i) for i in ids])
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import httpx
+
+from main import (
+    BASE_URL,
+    AttachNoteRequest,
+    Note,
+    NoteCreate,
+    NoteHierarchyRelation,
+    Tag,
+    TreeNote,
+    TreeTag,
+    _list_adapter,
+)
+
+
+@asynccontextmanager
+async def api_session(
+    base_url: str = BASE_URL, http2: bool = False
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a pre-configured client for the API"""
+    headers = {"Content-Type": "application/json"}
+    try:
+        client = httpx.AsyncClient(base_url=base_url, headers=headers, http2=http2)
+    except ImportError:
+        # http2 support needs the optional h2 package; fall back to HTTP/1.1
+        client = httpx.AsyncClient(base_url=base_url, headers=headers)
+    async with client:
+        yield client
+
+
+async def note_create_async(
+    client: httpx.AsyncClient, title: str, content: str
+) -> Note:
+    """Create a new note"""
+    request_data = NoteCreate(title=title, content=content)
+    response = await client.post(
+        "/notes/flat", content=request_data.model_dump_json()
+    )
+    response.raise_for_status()
+    return Note.model_validate(response.json())
+
+
+async def create_notes_async(
+    client: httpx.AsyncClient, items: List[NoteCreate], concurrency: int = 16
+) -> List[Note]:
+    """Create many notes concurrently with bounded fan-out
+
+    A semaphore caps in-flight POSTs at `concurrency` so bulk imports
+    approach the server's throughput limit without overwhelming it.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create_one(item: NoteCreate) -> Note:
+        async with semaphore:
+            response = await client.post(
+                "/notes/flat", content=item.model_dump_json()
+            )
+            response.raise_for_status()
+            return Note.model_validate(response.json())
+
+    return list(await asyncio.gather(*(create_one(item) for item in items)))
+
+
+async def _create_notes(
+    items: List[NoteCreate], base_url: str, concurrency: int
+) -> List[Note]:
+    async with api_session(base_url, http2=True) as client:
+        return await create_notes_async(client, items, concurrency)
+
+
+def create_notes(
+    items, base_url: str = BASE_URL, concurrency: int = 16
+) -> List[Note]:
+    """Synchronous convenience wrapper around create_notes_async
+
+    Items may be NoteCreate instances or plain dicts with title/content.
+    """
+    items = [
+        item if isinstance(item, NoteCreate) else NoteCreate(**item)
+        for item in items
+    ]
+    return asyncio.run(_create_notes(items, base_url, concurrency))
+
+
+async def get_note_async(client: httpx.AsyncClient, note_id: int) -> Note:
+    """Get a note by its ID"""
+    response = await client.get(f"/notes/flat/{note_id}")
+    response.raise_for_status()
+    return Note.model_validate(response.json())
+
+
+async def get_notes_async(
+    client: httpx.AsyncClient, note_ids: List[int]
+) -> List[Note]:
+    """Fetch many notes concurrently over one client"""
+    return list(
+        await asyncio.gather(*(get_note_async(client, i) for i in note_ids))
+    )
+
+
+async def _get_notes(note_ids: List[int], base_url: str) -> List[Note]:
+    async with api_session(base_url, http2=True) as client:
+        return await get_notes_async(client, note_ids)
+
+
+def get_notes(note_ids: List[int], base_url: str = BASE_URL) -> List[Note]:
+    """Synchronous convenience wrapper around get_notes_async
+
+    The whole batch is pipelined over a single connection (HTTP/2 when
+    the optional h2 package is installed), so latency approaches that of
+    the slowest single request instead of the sum.
+    """
+    return asyncio.run(_get_notes(note_ids, base_url))
+
+
+async def get_all_notes_async(client: httpx.AsyncClient) -> List[Note]:
+    """Get all notes"""
+    response = await client.get("/notes/flat")
+    response.raise_for_status()
+    return _list_adapter(Note).validate_json(response.content)
+
+
+async def update_note_async(
+    client: httpx.AsyncClient, note_id: int, title: str, content: str
+) -> Note:
+    """Update an existing note"""
+    request_data = NoteCreate(title=title, content=content)
+    response = await client.put(
+        f"/notes/flat/{note_id}", content=request_data.model_dump_json()
+    )
+    response.raise_for_status()
+    return Note.model_validate(response.json())
+
+
+async def delete_note_async(client: httpx.AsyncClient, note_id: int) -> None:
+    """Delete a note by its ID"""
+    response = await client.delete(f"/notes/flat/{note_id}")
+    response.raise_for_status()
+
+
+async def get_notes_tree_async(client: httpx.AsyncClient) -> List[TreeNote]:
+    """Get all notes in their hierarchical structure"""
+    response = await client.get("/notes/tree")
+    response.raise_for_status()
+    return _list_adapter(TreeNote).validate_json(response.content)
+
+
+async def get_note_hierarchy_relations_async(
+    client: httpx.AsyncClient,
+) -> List[NoteHierarchyRelation]:
+    """Get all parent/child relations between notes"""
+    response = await client.get("/notes/hierarchy")
+    response.raise_for_status()
+    return _list_adapter(NoteHierarchyRelation).validate_json(response.content)
+
+
+async def attach_note_to_parent_async(
+    client: httpx.AsyncClient, child_note_id: int, parent_note_id: int
+) -> None:
+    """Attach a note as a child of another note"""
+    request_data = AttachNoteRequest(
+        parent_note_id=parent_note_id, child_note_id=child_note_id
+    )
+    response = await client.post(
+        "/notes/hierarchy/attach", content=request_data.model_dump_json()
+    )
+    response.raise_for_status()
+
+
+async def get_tag_async(client: httpx.AsyncClient, tag_id: int) -> Tag:
+    """Get a tag by its ID"""
+    response = await client.get(f"/tags/{tag_id}")
+    response.raise_for_status()
+    return Tag.model_validate(response.json())
+
+
+async def get_all_tags_async(client: httpx.AsyncClient) -> List[Tag]:
+    """Get all tags"""
+    response = await client.get("/tags")
+    response.raise_for_status()
+    return _list_adapter(Tag).validate_json(response.content)
+
+
+async def get_tags_tree_async(client: httpx.AsyncClient) -> List[TreeTag]:
+    """Get all tags in their hierarchical structure"""
+    response = await client.get("/tags/tree")
+    response.raise_for_status()
+    return _list_adapter(TreeTag).validate_json(response.content)
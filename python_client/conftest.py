@@ -0,0 +1,114 @@
+import os
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from main import get_note, note_create
+
+# Namespace shared state per xdist worker so parallel runs never race on
+# the same seed notes.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+@pytest.fixture(scope="session")
+def api():
+    """One pooled session shared by the whole suite
+
+    Keep-alive across tests means the TCP handshake is paid once per
+    suite instead of once per call.
+    """
+    with requests.Session() as session:
+        session.headers["Content-Type"] = "application/json"
+        session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.1),
+            ),
+        )
+        yield session
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wait_for_api(api):
+    """Gate the suite on the API being reachable
+
+    Polls once per session instead of every test discovering the down
+    server through its own connection-refused retry, and gives a single
+    clean skip when it never comes up.
+    """
+    from main import BASE_URL
+
+    for _ in range(20):
+        try:
+            api.get(f"{BASE_URL}/notes/flat?exclude_content=true", timeout=0.5)
+            return
+        except requests.exceptions.RequestException:
+            # Covers both refused connections and read timeouts from a
+            # server that accepts connections while still starting up.
+            time.sleep(0.25)
+    pytest.skip("API server is not running")
+
+
+def _cached_note(request, api, key: str, title: str, content: str):
+    """Reuse a seed note from a previous run when it still exists
+
+    The note id persists in pytest's own cache (.pytest_cache), so
+    repeated local runs skip recreating identical seed data. CI stays
+    hermetic by running with --cache-clear.
+    """
+    cache_key = f"draftsmith/{key}/{_WORKER}"
+    note_id = request.config.cache.get(cache_key, None)
+    if note_id is not None:
+        try:
+            return get_note(note_id, session=api)
+        except requests.exceptions.HTTPError:
+            pass  # stale id from a wiped database; fall through and recreate
+    note = note_create(title, content, session=api)
+    request.config.cache.set(cache_key, note.id)
+    return note
+
+
+@pytest.fixture(scope="session")
+def seed_note(request, api):
+    """One note created once per suite for the read-only tests"""
+    return _cached_note(
+        request, api, "seed_note", f"Test Note [{_WORKER}]", "This is a test note"
+    )
+
+
+@pytest.fixture(scope="session")
+def parent_note(request, api):
+    return _cached_note(
+        request, api, "parent_note", f"Parent Note [{_WORKER}]", "This is the parent"
+    )
+
+
+@pytest.fixture(scope="session")
+def child_note(request, api):
+    return _cached_note(
+        request, api, "child_note", f"Child Note [{_WORKER}]", "This is the child"
+    )
+
+
+@pytest.fixture(scope="session")
+def http2_api():
+    """httpx client for multiplexed test calls
+
+    Many small GETs share one HTTP/2 connection instead of one socket
+    each; falls back to HTTP/1.1 keep-alive when h2 is not installed.
+    """
+    import httpx
+
+    from main import BASE_URL
+
+    limits = httpx.Limits(max_keepalive_connections=20)
+    try:
+        client = httpx.Client(base_url=BASE_URL, http2=True, limits=limits)
+    except ImportError:
+        client = httpx.Client(base_url=BASE_URL, limits=limits)
+    with client:
+        yield client
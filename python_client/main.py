@@ -0,0 +1,716 @@
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    import requests
+
+BASE_URL = "http://localhost:37240"
+
+__all__ = [
+    "BASE_URL",
+    "configure",
+    "close",
+    "NoteCreate",
+    "Note",
+    "NoteMetadata",
+    "Tag",
+    "TreeNote",
+    "TreeNoteSummary",
+    "TreeTag",
+    "NoteHierarchyRelation",
+    "AttachNoteRequest",
+    "note_create",
+    "bulk_create_notes",
+    "get_note",
+    "get_all_notes",
+    "update_note",
+    "delete_note",
+    "get_notes_tree",
+    "iter_notes_tree",
+    "get_notes_tree_summary",
+    "fetch_note_content",
+    "update_notes_tree",
+    "get_note_hierarchy_relations",
+    "attach_note_to_parent",
+    "detach_note_from_parent",
+    "create_tag",
+    "get_tag",
+    "update_tag",
+    "delete_tag",
+    "get_all_tags",
+    "get_tags_tree",
+]
+
+_SESSION = None
+
+
+def _session():
+    """Build the shared session on first use
+
+    Deferring the requests import and pool setup keeps importing this
+    module cheap for callers that only want the model types.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.headers["Content-Type"] = "application/json"
+        _SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+        _SESSION.mount(BASE_URL, HTTPAdapter(pool_connections=16, pool_maxsize=64))
+    return _SESSION
+
+
+def configure(base_url: str = BASE_URL) -> None:
+    """Mount a keep-alive connection pool for the API host"""
+    from requests.adapters import HTTPAdapter
+
+    _session().mount(base_url, HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+
+def close() -> None:
+    """Release the session's pooled connections"""
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+@lru_cache(maxsize=1)
+def _msgspec():
+    """Import the msgspec decoders on first use; None when unavailable"""
+    try:
+        import msgspec_models
+    except ImportError:
+        return None
+    return msgspec_models
+
+
+try:
+    import orjson
+
+    def _json(response):
+        """Parse a response body with orjson, skipping stdlib json"""
+        return orjson.loads(response.content)
+
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json(response):
+        return json.loads(response.content)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def _to_json(model: BaseModel) -> bytes:
+    """Serialize a model straight through pydantic-core's Rust serializer"""
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class _Urls:
+    """Endpoint URLs precomputed once per base URL"""
+
+    __slots__ = (
+        "notes_flat",
+        "notes_tree",
+        "notes_hierarchy",
+        "notes_hierarchy_attach",
+        "notes_hierarchy_detach",
+        "tags",
+        "tags_tree",
+    )
+
+    def __init__(self, base_url: str):
+        self.notes_flat = f"{base_url}/notes/flat"
+        self.notes_tree = f"{base_url}/notes/tree"
+        self.notes_hierarchy = f"{base_url}/notes/hierarchy"
+        self.notes_hierarchy_attach = f"{base_url}/notes/hierarchy/attach"
+        self.notes_hierarchy_detach = f"{base_url}/notes/hierarchy/detach"
+        self.tags = f"{base_url}/tags"
+        self.tags_tree = f"{base_url}/tags/tree"
+
+
+@lru_cache(maxsize=8)
+def _urls(base_url: str) -> _Urls:
+    return _Urls(base_url)
+
+
+class NoteCreate(BaseModel):
+    title: str
+    content: str
+
+
+class Note(BaseModel):
+    id: int
+    title: str
+    content: str
+    created_at: datetime
+    modified_at: datetime
+
+
+class NoteMetadata(BaseModel):
+    id: int
+    title: str
+    created_at: datetime
+    modified_at: datetime
+
+
+class Tag(BaseModel):
+    id: int
+    name: str
+
+
+class TreeNote(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    created_at: Optional[datetime] = None
+    modified_at: Optional[datetime] = None
+    children: List["TreeNote"] = []
+    tags: List[Tag] = []
+
+
+class TreeTag(BaseModel):
+    id: int
+    name: str
+    children: List["TreeTag"] = []
+    notes: List[NoteMetadata] = []
+
+
+class TreeNoteSummary(BaseModel):
+    id: int
+    title: Optional[str] = None
+    children: List["TreeNoteSummary"] = []
+    tags: List[Tag] = []
+
+
+class NoteHierarchyRelation(BaseModel):
+    parent_id: Optional[int] = None
+    child_id: int
+
+
+class AttachNoteRequest(BaseModel):
+    parent_note_id: Optional[int] = None
+    child_note_id: int
+
+
+# Collection endpoints change more often than single tags, so they get a
+# short TTL instead of an unbounded cache.
+_COLLECTION_TTL_SECONDS = 5.0
+_collection_cache: Dict = {}
+
+
+def _cached_collection(key, fetch):
+    now = time.monotonic()
+    hit = _collection_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    value = fetch()
+    _collection_cache[key] = (now + _COLLECTION_TTL_SECONDS, value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model) -> TypeAdapter:
+    """Build each list TypeAdapter once, on first use"""
+    return TypeAdapter(List[model])
+
+
+def _parse_datetime(value):
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _construct_note(data: Dict) -> Note:
+    """Build a Note from a trusted payload without re-validating it"""
+    data["created_at"] = _parse_datetime(data["created_at"])
+    data["modified_at"] = _parse_datetime(data["modified_at"])
+    return Note.model_construct(**data)
+
+
+def _construct_note_tree(data: Dict) -> TreeNote:
+    """Recursively build a TreeNote from a trusted payload"""
+    for key in ("created_at", "modified_at"):
+        if data.get(key) is not None:
+            data[key] = _parse_datetime(data[key])
+    children = [_construct_note_tree(child) for child in data.pop("children", [])]
+    tags = [Tag.model_construct(**tag) for tag in data.pop("tags", [])]
+    return TreeNote.model_construct(children=children, tags=tags, **data)
+
+
+def _construct_note_tree_summary(data: Dict) -> TreeNoteSummary:
+    """Recursively build a TreeNoteSummary from a trusted payload"""
+    children = [
+        _construct_note_tree_summary(child) for child in data.pop("children", [])
+    ]
+    tags = [Tag.model_construct(**tag) for tag in data.pop("tags", [])]
+    return TreeNoteSummary.model_construct(
+        id=data["id"], title=data.get("title"), children=children, tags=tags
+    )
+
+
+def _construct_tag_tree(data: Dict) -> TreeTag:
+    """Recursively build a TreeTag from a trusted payload"""
+    children = [_construct_tag_tree(child) for child in data.pop("children", [])]
+    notes = [_construct_note_metadata(note) for note in data.pop("notes", [])]
+    return TreeTag.model_construct(children=children, notes=notes, **data)
+
+
+def _construct_note_metadata(data: Dict) -> NoteMetadata:
+    data["created_at"] = _parse_datetime(data["created_at"])
+    data["modified_at"] = _parse_datetime(data["modified_at"])
+    return NoteMetadata.model_construct(**data)
+
+
+# msgspec decodes (and type-checks) the raw bytes in C; these copy the
+# resulting structs into the Pydantic models via model_construct so the
+# trusted paths return the same types as the validated ones.
+
+
+def _note_from_struct(struct) -> Note:
+    return Note.model_construct(
+        id=struct.id,
+        title=struct.title,
+        content=struct.content,
+        created_at=struct.created_at,
+        modified_at=struct.modified_at,
+    )
+
+
+def _tag_from_struct(struct) -> Tag:
+    return Tag.model_construct(id=struct.id, name=struct.name)
+
+
+def _note_tree_from_struct(struct) -> TreeNote:
+    return TreeNote.model_construct(
+        id=struct.id,
+        title=struct.title,
+        content=struct.content,
+        created_at=struct.created_at,
+        modified_at=struct.modified_at,
+        children=[_note_tree_from_struct(child) for child in struct.children],
+        tags=[_tag_from_struct(tag) for tag in struct.tags],
+    )
+
+
+def _note_tree_summary_from_struct(struct) -> TreeNoteSummary:
+    return TreeNoteSummary.model_construct(
+        id=struct.id,
+        title=struct.title,
+        children=[_note_tree_summary_from_struct(child) for child in struct.children],
+        tags=[_tag_from_struct(tag) for tag in struct.tags],
+    )
+
+
+def _tag_tree_from_struct(struct) -> TreeTag:
+    return TreeTag.model_construct(
+        id=struct.id,
+        name=struct.name,
+        children=[_tag_tree_from_struct(child) for child in struct.children],
+        notes=[
+            NoteMetadata.model_construct(
+                id=note.id,
+                title=note.title,
+                created_at=note.created_at,
+                modified_at=note.modified_at,
+            )
+            for note in struct.notes
+        ],
+    )
+
+
+def note_create(
+    title: str,
+    content: str,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> Note:
+    """Create a new note"""
+    request_data = NoteCreate(title=title, content=content)
+    response = (session or _session()).post(
+        _urls(base_url).notes_flat,
+        data=_to_json(request_data),
+    )
+    response.raise_for_status()
+    return Note.model_validate_json(response.content)
+
+
+def bulk_create_notes(
+    items: List[NoteCreate],
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+    max_workers: int = 8,
+) -> List[Note]:
+    """Create many notes concurrently over the pooled session
+
+    The API has no bulk-create endpoint, so the POSTs are issued from a
+    thread pool sharing one connection pool; results come back in input
+    order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    s = session or _session()
+
+    def create_one(item: NoteCreate) -> Note:
+        response = s.post(_urls(base_url).notes_flat, data=_to_json(item))
+        response.raise_for_status()
+        return Note.model_validate_json(response.content)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items) or 1)) as pool:
+        return list(pool.map(create_one, items))
+
+
+def get_note(
+    note_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> Note:
+    """Get a note by its ID"""
+    response = (session or _session()).get(f"{_urls(base_url).notes_flat}/{note_id}")
+    response.raise_for_status()
+    return Note.model_validate_json(response.content)
+
+
+def get_all_notes(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[Note]:
+    """Get all notes
+
+    When trusted is True the server payload skips Pydantic validation
+    and is loaded with model_construct, which is far faster on large
+    responses.
+    """
+    response = (session or _session()).get(_urls(base_url).notes_flat)
+    response.raise_for_status()
+    if trusted:
+        ms = _msgspec()
+        if ms is not None:
+            return [_note_from_struct(s) for s in ms.NOTE_LIST_DECODER.decode(response.content)]
+        return [_construct_note(n) for n in _json(response)]
+    return _list_adapter(Note).validate_json(response.content)
+
+
+def update_note(
+    note_id: int,
+    title: str,
+    content: str,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> Note:
+    """Update an existing note"""
+    request_data = NoteCreate(title=title, content=content)
+    response = (session or _session()).put(
+        f"{_urls(base_url).notes_flat}/{note_id}",
+        data=_to_json(request_data),
+    )
+    response.raise_for_status()
+    return Note.model_validate_json(response.content)
+
+
+def delete_note(
+    note_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> None:
+    """Delete a note by its ID"""
+    response = (session or _session()).delete(f"{_urls(base_url).notes_flat}/{note_id}")
+    response.raise_for_status()
+    # Deletion cascades through hierarchy rows on the server.
+    _collection_cache.clear()
+
+
+def get_notes_tree(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[TreeNote]:
+    """Get all notes in their hierarchical structure"""
+    response = (session or _session()).get(_urls(base_url).notes_tree)
+    response.raise_for_status()
+    if trusted:
+        ms = _msgspec()
+        if ms is not None:
+            return [
+                _note_tree_from_struct(s)
+                for s in ms.TREE_NOTE_LIST_DECODER.decode(response.content)
+            ]
+        return [_construct_note_tree(n) for n in _json(response)]
+    return _list_adapter(TreeNote).validate_json(response.content)
+
+
+def iter_notes_tree(base_url: str = BASE_URL, session: Optional["requests.Session"] = None):
+    """Stream the notes tree, yielding one top-level subtree at a time
+
+    Instead of buffering the whole payload and decoding it in one go,
+    the response is streamed and parsed incrementally with ijson, so
+    peak memory stays at one subtree and callers can start processing
+    before the download finishes. Requires the optional ijson package.
+    """
+    import ijson
+
+    with (session or _session()).get(_urls(base_url).notes_tree, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        for note_dict in ijson.items(response.raw, "item"):
+            yield _construct_note_tree(note_dict)
+
+
+def get_notes_tree_summary(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[TreeNoteSummary]:
+    """Get the notes hierarchy without note contents
+
+    Uses the server's exclude_content support so only summary fields
+    travel over the wire; hydrate individual nodes on demand with
+    fetch_note_content.
+    """
+    response = (session or _session()).get(
+        _urls(base_url).notes_tree, params={"exclude_content": "true"}
+    )
+    response.raise_for_status()
+    if trusted:
+        ms = _msgspec()
+        if ms is not None:
+            return [
+                _note_tree_summary_from_struct(s)
+                for s in ms.TREE_NOTE_SUMMARY_LIST_DECODER.decode(response.content)
+            ]
+        return [_construct_note_tree_summary(n) for n in _json(response)]
+    return _list_adapter(TreeNoteSummary).validate_json(response.content)
+
+
+def fetch_note_content(
+    note_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> str:
+    """Fetch a single note's content for lazy loading of tree nodes"""
+    return get_note(note_id, base_url=base_url, session=session).content
+
+
+# Top-level subtree id -> (fingerprint, serialized bytes) from the last
+# update_notes_tree call.
+_subtree_json_cache: Dict[int, tuple] = {}
+
+
+def _fingerprint_subtree(node: TreeNote) -> int:
+    """Hash every serialized field of a subtree, recursively
+
+    Covers the same fields _to_json emits, so equal fingerprints mean
+    the cached bytes are still an exact serialization of the subtree —
+    including nodes that were moved out of it since the last call.
+    """
+    return hash(
+        (
+            node.id,
+            node.title,
+            node.content,
+            node.created_at,
+            node.modified_at,
+            tuple((tag.id, tag.name) for tag in node.tags),
+            tuple(_fingerprint_subtree(child) for child in node.children),
+        )
+    )
+
+
+def update_notes_tree(
+    notes: List[TreeNote],
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> None:
+    """Update the entire notes tree structure
+
+    Serialized bytes for each top-level subtree are cached against a
+    fingerprint of the subtree's contents; subtrees whose fingerprint
+    has not changed since the previous call reuse the cached bytes, so
+    serialization work scales with the size of the edit rather than the
+    size of the tree. The full tree still travels over the wire — the
+    server replaces the whole hierarchy on PUT.
+    """
+    parts = []
+    for note in notes:
+        fingerprint = _fingerprint_subtree(note)
+        hit = _subtree_json_cache.get(note.id)
+        if hit is not None and hit[0] == fingerprint:
+            parts.append(hit[1])
+            continue
+        serialized = _to_json(note)
+        _subtree_json_cache[note.id] = (fingerprint, serialized)
+        parts.append(serialized)
+    top_ids = {note.id for note in notes}
+    for stale_id in [i for i in _subtree_json_cache if i not in top_ids]:
+        del _subtree_json_cache[stale_id]
+    body = b"[" + b",".join(parts) + b"]"
+    response = (session or _session()).put(_urls(base_url).notes_tree, data=body)
+    response.raise_for_status()
+    _collection_cache.clear()
+
+
+def get_note_hierarchy_relations(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[NoteHierarchyRelation]:
+    """Get all parent/child relations between notes"""
+
+    def fetch():
+        response = (session or _session()).get(_urls(base_url).notes_hierarchy)
+        response.raise_for_status()
+        if trusted:
+            ms = _msgspec()
+            if ms is not None:
+                return [
+                    NoteHierarchyRelation.model_construct(
+                        parent_id=s.parent_id, child_id=s.child_id
+                    )
+                    for s in ms.HIERARCHY_RELATION_LIST_DECODER.decode(
+                        response.content
+                    )
+                ]
+            return [
+                NoteHierarchyRelation.model_construct(**r) for r in _json(response)
+            ]
+        return _list_adapter(NoteHierarchyRelation).validate_json(response.content)
+
+    return _cached_collection(("note_hierarchy", base_url, trusted), fetch)
+
+
+def attach_note_to_parent(
+    child_note_id: int,
+    parent_note_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> None:
+    """Attach a note as a child of another note"""
+    request_data = AttachNoteRequest(
+        parent_note_id=parent_note_id, child_note_id=child_note_id
+    )
+    response = (session or _session()).post(
+        _urls(base_url).notes_hierarchy_attach,
+        data=_to_json(request_data),
+    )
+    response.raise_for_status()
+    _collection_cache.clear()
+
+
+def detach_note_from_parent(
+    child_note_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> None:
+    """Detach a note from its parent"""
+    response = (session or _session()).delete(f"{_urls(base_url).notes_hierarchy_detach}/{child_note_id}")
+    response.raise_for_status()
+    _collection_cache.clear()
+
+
+def create_tag(
+    name: str, base_url: str = BASE_URL, session: Optional["requests.Session"] = None
+) -> Tag:
+    """Create a new tag"""
+    response = (session or _session()).post(
+        _urls(base_url).tags,
+        data=_dumps({"name": name}),
+    )
+    response.raise_for_status()
+    _collection_cache.clear()
+    return Tag.model_validate_json(response.content)
+
+
+@lru_cache(maxsize=1024)
+def _get_tag_cached(tag_id: int, base_url: str) -> Tag:
+    response = _session().get(f"{_urls(base_url).tags}/{tag_id}")
+    response.raise_for_status()
+    return Tag.model_validate_json(response.content)
+
+
+def get_tag(
+    tag_id: int, base_url: str = BASE_URL, session: Optional["requests.Session"] = None
+) -> Tag:
+    """Get a tag by its ID (cached; tags rarely change within a session)"""
+    if session is None:
+        return _get_tag_cached(tag_id, base_url)
+    response = session.get(f"{_urls(base_url).tags}/{tag_id}")
+    response.raise_for_status()
+    return Tag.model_validate_json(response.content)
+
+
+def update_tag(
+    tag_id: int,
+    name: str,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> Tag:
+    """Update an existing tag"""
+    response = (session or _session()).put(
+        f"{_urls(base_url).tags}/{tag_id}",
+        data=_dumps({"name": name}),
+    )
+    response.raise_for_status()
+    _get_tag_cached.cache_clear()
+    _collection_cache.clear()
+    return Tag.model_validate_json(response.content)
+
+
+def delete_tag(
+    tag_id: int,
+    base_url: str = BASE_URL,
+    session: Optional["requests.Session"] = None,
+) -> None:
+    """Delete a tag by its ID"""
+    response = (session or _session()).delete(f"{_urls(base_url).tags}/{tag_id}")
+    response.raise_for_status()
+    _get_tag_cached.cache_clear()
+    _collection_cache.clear()
+
+
+def get_all_tags(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[Tag]:
+    """Get all tags"""
+
+    def fetch():
+        response = (session or _session()).get(_urls(base_url).tags)
+        response.raise_for_status()
+        if trusted:
+            ms = _msgspec()
+            if ms is not None:
+                return [
+                    _tag_from_struct(s)
+                    for s in ms.TAG_LIST_DECODER.decode(response.content)
+                ]
+            return [Tag.model_construct(**t) for t in _json(response)]
+        return _list_adapter(Tag).validate_json(response.content)
+
+    return _cached_collection(("tags", base_url, trusted), fetch)
+
+
+def get_tags_tree(
+    base_url: str = BASE_URL,
+    trusted: bool = True,
+    session: Optional["requests.Session"] = None,
+) -> List[TreeTag]:
+    """Get all tags in their hierarchical structure"""
+    response = (session or _session()).get(_urls(base_url).tags_tree)
+    response.raise_for_status()
+    if trusted:
+        ms = _msgspec()
+        if ms is not None:
+            return [
+                _tag_tree_from_struct(s)
+                for s in ms.TREE_TAG_LIST_DECODER.decode(response.content)
+            ]
+        return [_construct_tag_tree(t) for t in _json(response)]
+    return _list_adapter(TreeTag).validate_json(response.content)
@@ -0,0 +1,71 @@
+"""msgspec mirrors of the response models in main.py.
+
+Decoding raw response bytes with a cached ``msgspec.json.Decoder`` skips
+both stdlib JSON parsing and Pydantic validation, and avoids building the
+intermediate dicts entirely. The structs are an internal decode step:
+main.py copies them into the matching Pydantic models via
+``model_construct`` before returning, so callers only ever see one type.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+import msgspec
+
+
+class Tag(msgspec.Struct):
+    id: int
+    name: str
+
+
+class Note(msgspec.Struct):
+    id: int
+    title: str
+    content: str
+    created_at: datetime
+    modified_at: datetime
+
+
+class NoteMetadata(msgspec.Struct):
+    id: int
+    title: str
+    created_at: datetime
+    modified_at: datetime
+
+
+class TreeNote(msgspec.Struct):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    created_at: Optional[datetime] = None
+    modified_at: Optional[datetime] = None
+    children: List["TreeNote"] = msgspec.field(default_factory=list)
+    tags: List[Tag] = msgspec.field(default_factory=list)
+
+
+class TreeNoteSummary(msgspec.Struct):
+    id: int
+    title: Optional[str] = None
+    children: List["TreeNoteSummary"] = msgspec.field(default_factory=list)
+    tags: List[Tag] = msgspec.field(default_factory=list)
+
+
+class TreeTag(msgspec.Struct):
+    id: int
+    name: str
+    children: List["TreeTag"] = msgspec.field(default_factory=list)
+    notes: List[NoteMetadata] = msgspec.field(default_factory=list)
+
+
+class NoteHierarchyRelation(msgspec.Struct):
+    child_id: int
+    parent_id: Optional[int] = None
+
+
+NOTE_DECODER = msgspec.json.Decoder(Note)
+NOTE_LIST_DECODER = msgspec.json.Decoder(List[Note])
+TREE_NOTE_LIST_DECODER = msgspec.json.Decoder(List[TreeNote])
+TREE_NOTE_SUMMARY_LIST_DECODER = msgspec.json.Decoder(List[TreeNoteSummary])
+TREE_TAG_LIST_DECODER = msgspec.json.Decoder(List[TreeTag])
+TAG_LIST_DECODER = msgspec.json.Decoder(List[Tag])
+HIERARCHY_RELATION_LIST_DECODER = msgspec.json.Decoder(List[NoteHierarchyRelation])
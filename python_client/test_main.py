@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from async_client import get_notes
+from main import (
+    NoteCreate,
+    TreeNote,
+    TreeTag,
+    attach_note_to_parent,
+    bulk_create_notes,
+    create_tag,
+    delete_note,
+    detach_note_from_parent,
+    get_all_notes,
+    get_all_tags,
+    get_note,
+    get_note_hierarchy_relations,
+    get_notes_tree,
+    get_tag,
+    get_tags_tree,
+    note_create,
+    update_note,
+    update_notes_tree,
+)
+
+
+def test_note_create(api):
+    note = note_create("Test Note", "This is a test note", session=api)
+    assert note.id is not None
+    assert note.title == "Test Note"
+    assert note.content == "This is a test note"
+
+
+def test_get_note(api, seed_note):
+    note = get_note(seed_note.id, session=api)
+    assert note.id == seed_note.id
+    assert note.title == seed_note.title
+    assert note.content == seed_note.content
+
+
+def test_get_all_notes(api, seed_note):
+    notes = get_all_notes(session=api)
+    assert len(notes) > 0
+    assert any(n.id == seed_note.id for n in notes)
+
+
+def test_update_note(api):
+    created = note_create("Test Note", "This is a test note", session=api)
+    updated = update_note(
+        created.id, "Updated Note", "This note has been updated", session=api
+    )
+    assert updated.id == created.id
+    assert updated.title == "Updated Note"
+    assert updated.content == "This note has been updated"
+
+
+def test_delete_note(api):
+    created = note_create("Test Note", "This is a test note", session=api)
+    delete_note(created.id, session=api)
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_note(created.id, session=api)
+
+
+def test_get_notes_tree(api, seed_note):
+    # The client type-checks the whole payload while decoding (msgspec
+    # or a precompiled TypeAdapter), including every nested child and
+    # tag; a spot check on the root is enough here.
+    tree = get_notes_tree(session=api)
+    assert len(tree) > 0
+    assert isinstance(tree[0], TreeNote)
+
+
+def test_attach_note_to_parent(api, parent_note, child_note):
+    attach_note_to_parent(child_note.id, parent_note.id, session=api)
+
+    tree = get_notes_tree(session=api)
+    by_id = {n.id: n for n in tree}
+    parent = by_id.get(parent_note.id)
+    assert parent is not None
+    assert any(c.id == child_note.id for c in parent.children)
+
+
+def test_detach_note_from_parent(api):
+    parent, child = bulk_create_notes(
+        [
+            NoteCreate(title="Parent Note", content="This is the parent"),
+            NoteCreate(title="Child Note", content="This is the child"),
+        ],
+        session=api,
+    )
+    attach_note_to_parent(child.id, parent.id, session=api)
+
+    detach_note_from_parent(child.id, session=api)
+
+    tree = get_notes_tree(session=api)
+    by_id = {n.id: n for n in tree}
+    parent_note = by_id.get(parent.id)
+    assert parent_note is not None
+    assert all(c.id != child.id for c in parent_note.children)
+
+
+def test_get_note_hierarchy_relations(api, parent_note, child_note):
+    attach_note_to_parent(child_note.id, parent_note.id, session=api)
+
+    relations = get_note_hierarchy_relations(session=api)
+    assert any(
+        r.parent_id == parent_note.id and r.child_id == child_note.id
+        for r in relations
+    )
+
+
+def test_update_notes_tree(api):
+    created = note_create("Tree Note", "Before tree update", session=api)
+    tree = get_notes_tree(session=api)
+    for note in tree:
+        if note.id == created.id:
+            note.content = "After tree update"
+
+    update_notes_tree(tree, session=api)
+
+    updated_tree = get_notes_tree(session=api)
+    by_id = {n.id: n for n in updated_tree}
+    updated_note = by_id.get(created.id)
+    assert updated_note is not None
+    assert updated_note.content == "After tree update"
+
+
+def test_get_notes_batch(api):
+    created = bulk_create_notes(
+        [
+            NoteCreate(title=f"Batch Note {i}", content=f"Batch content {i}")
+            for i in range(3)
+        ],
+        session=api,
+    )
+
+    notes = get_notes([n.id for n in created])
+    assert [n.id for n in notes] == [n.id for n in created]
+    assert all(n.content.startswith("Batch content") for n in notes)
+
+
+def test_multiplexed_gets(http2_api, seed_note):
+    # The GETs must be in flight at the same time to multiplex over the
+    # shared connection; sequential calls would only test keep-alive.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(http2_api.get, f"/notes/flat/{seed_note.id}")
+            for _ in range(5)
+        ]
+        responses = [future.result() for future in futures]
+    assert all(r.status_code == 200 for r in responses)
+
+
+def test_create_tag(api):
+    tag = create_tag("test-tag", session=api)
+    assert tag.id is not None
+    assert tag.name == "test-tag"
+
+
+def test_get_tag(api):
+    created = create_tag("test-tag", session=api)
+    tag = get_tag(created.id, session=api)
+    assert tag.id == created.id
+    assert tag.name == created.name
+
+
+def test_get_all_tags(api):
+    created = create_tag("test-tag", session=api)
+    tags = get_all_tags(session=api)
+    assert any(t.id == created.id for t in tags)
+
+
+def test_get_tags_tree(api):
+    create_tag("test-tag", session=api)
+    tree = get_tags_tree(session=api)
+    assert len(tree) > 0
+    assert isinstance(tree[0], TreeTag)